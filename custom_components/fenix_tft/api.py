@@ -3,17 +3,20 @@
 import asyncio
 import base64
 import hashlib
-import json
+import html
 import logging
+import re
 import secrets
 import time
 import urllib.parse
-from datetime import UTC, datetime
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import aiohttp
-from bs4 import BeautifulSoup
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .const import (
     API_BASE,
@@ -29,6 +32,8 @@ from .const import (
     HTTP_REDIRECT,
     HTTP_SERVER_ERROR,
     HTTP_SUCCESS_MAX,
+    HTTP_UNAUTHORIZED,
+    POLLING_INTERVAL,
     REDIRECT_URI,
     SCOPES,
     VALID_PRESET_MODES,
@@ -39,12 +44,59 @@ _LOGGER = logging.getLogger(__name__)
 # URL template for energy consumption endpoint
 ENERGY_CONSUMPTION_URL_TEMPLATE = (
     "{base_url}/DataProcessing/v1/metricsAggregat/consommation/room/"
-    "{installation_id}/{room_id}/{subscription_id}/Hour/Wc/{start_date}/{end_date}"
+    "{installation_id}/{room_id}/{subscription_id}/{period}/Wc/{start_date}/{end_date}"
 )
 
 # Maximum concurrent energy data requests to avoid API rate limiting
 MAX_CONCURRENT_ENERGY_REQUESTS = 5
 
+# Maximum concurrent device property requests while listing devices
+MAX_CONCURRENT_PROPERTY_REQUESTS = 5
+
+# Shared timeout for API requests, built once rather than per call
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=API_TIMEOUT_SECONDS)
+
+# Seconds to reuse the installations list before fetching it again; spans
+# several poll intervals so regular refreshes actually hit the cache
+INSTALLATIONS_CACHE_TTL = 3 * POLLING_INTERVAL
+
+# OAuth2 token endpoint for code exchange and refresh
+TOKEN_URL = f"{API_IDENTITY}/connect/token"
+
+# Authorize URL with the query parameters that are the same for every login
+_AUTHORIZE_URL_PREFIX = f"{API_IDENTITY}/connect/authorize?" + urllib.parse.urlencode(
+    {
+        "client_id": CLIENT_ID,
+        "response_type": "code id_token",
+        "scope": SCOPES,
+        "redirect_uri": REDIRECT_URI,
+        "code_challenge_method": "S256",
+        "oemclient": "fenix",
+    }
+)
+
+# Static holiday cancel entries; only serialized, never mutated
+_HOLIDAY_CANCEL_DATA: tuple[dict[str, Any], ...] = (
+    {"timestamp": None, "wattsType": "H1", "wattsTypeValue": HOLIDAY_EPOCH_DATE},
+    {"timestamp": None, "wattsType": "H2", "wattsTypeValue": HOLIDAY_EPOCH_DATE},
+    # Reset holiday mode to none (flat list form like schedule set)
+    {"timestamp": None, "wattsType": "H3", "wattsTypeValue": [0, 0, 0]},
+)
+
+# Hidden login form inputs, matched on the raw page bytes regardless of
+# attribute order. Attributes are anchored on whitespace so data-name= and
+# data-value= never match, and double-, single- or unquoted values all work.
+_INPUT_VALUE_RE = rb"[^>]*\svalue=(?:\"([^\"]*)\"|'([^']*)'|([^\s\"'=<>`]+))"
+_CSRF_INPUT_RE = re.compile(
+    rb"<input\b(?=[^>]*\sname=([\"']?)__RequestVerificationToken\1[\s/>])"
+    + _INPUT_VALUE_RE,
+    re.IGNORECASE,
+)
+_RETURN_URL_INPUT_RE = re.compile(
+    rb"<input\b(?=[^>]*\sname=([\"']?)ReturnUrl\1[\s/>])" + _INPUT_VALUE_RE,
+    re.IGNORECASE,
+)
+
 
 class FenixTFTApiError(Exception):
     """Exception raised for Fenix TFT API errors."""
@@ -74,26 +126,49 @@ def encode_temp_to_entry(temp_c: float, div_factor: int = 10) -> float:
 
 def generate_pkce_pair() -> tuple[str, str]:
     """Generate PKCE code verifier and challenge for OAuth2 security."""
-    code_verifier = secrets.token_urlsafe(96)[:128]
+    # 96 random bytes encode to exactly 128 characters, the RFC 7636 maximum
+    code_verifier = secrets.token_urlsafe(96)
     code_challenge = (
         base64.urlsafe_b64encode(hashlib.sha256(code_verifier.encode("ascii")).digest())
+        .rstrip(b"=")
         .decode("ascii")
-        .rstrip("=")
     )
     return code_verifier, code_challenge
 
 
+def _input_value(pattern: re.Pattern[bytes], page: bytes) -> str | None:
+    """Return the unescaped value of the first form input matching pattern."""
+    match = pattern.search(page)
+    if not match:
+        return None
+    # Group 1 is the name quote; the value is in whichever quote style matched
+    raw = match.group(2) or match.group(3) or match.group(4)
+    return html.unescape(raw.decode()) if raw else None
+
+
+def _prop_value(props: dict[str, Any], key: str, default: Any = None) -> Any:
+    """Return the value of a device property entry, or default if missing."""
+    entry = props.get(key)
+    return entry.get("value", default) if isinstance(entry, dict) else default
+
+
 def _format_api_date(date: datetime) -> str:
     """Format datetime for API consumption endpoints."""
-    return date.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    # Equivalent to strftime("%Y-%m-%dT%H:%M:%S.%fZ") without format parsing
+    return (
+        f"{date.year:04d}-{date.month:02d}-{date.day:02d}T"
+        f"{date.hour:02d}:{date.minute:02d}:{date.second:02d}."
+        f"{date.microsecond:06d}Z"
+    )
 
 
-def _build_energy_consumption_url(
+def _build_energy_consumption_url(  # noqa: PLR0913
     installation_id: str,
     room_id: str,
     subscription_id: str,
     start_date: datetime,
     end_date: datetime,
+    period: str = "Hour",
 ) -> str:
     """Build URL for room/subscription energy consumption API endpoint."""
     return ENERGY_CONSUMPTION_URL_TEMPLATE.format(
@@ -101,13 +176,20 @@ def _build_energy_consumption_url(
         installation_id=installation_id,
         room_id=room_id,
         subscription_id=subscription_id,
+        period=period,
         start_date=_format_api_date(start_date),
         end_date=_format_api_date(end_date),
     )
 
 
 class FenixTFTApi:
-    """Fenix TFT API client."""
+    """
+    Fenix TFT API client.
+
+    The client does not own its HTTP session. It is meant to be given Home
+    Assistant's shared session, whose pooled keep-alive connector is reused
+    across every request the client makes, and that session must outlive it.
+    """
 
     def __init__(
         self, session: aiohttp.ClientSession, username: str, password: str
@@ -120,7 +202,10 @@ class FenixTFTApi:
         self._refresh_token: str | None = None
         self._token_expires: float | None = None
         self._sub: str | None = None
-        self._login_in_progress = False
+        self._token_lock = asyncio.Lock()
+        self._headers_token: str | None = None
+        self._cached_headers: dict[str, str] = {}
+        self._installations_cache: tuple[float, list[dict[str, Any]]] | None = None
 
     @property
     def subscription_id(self) -> str | None:
@@ -128,48 +213,64 @@ class FenixTFTApi:
         return self._sub
 
     def _headers(self) -> dict[str, str]:
-        """Return standard headers with bearer token."""
-        return {
-            "Authorization": f"Bearer {self._access_token}",
-            "Accept": "application/json",
-        }
+        """
+        Return standard headers with bearer token.
+
+        The dict is shared between requests and only rebuilt when the access
+        token changes, so callers must not mutate it.
+        """
+        if self._headers_token != self._access_token or not self._cached_headers:
+            self._headers_token = self._access_token
+            self._cached_headers = {
+                "Authorization": f"Bearer {self._access_token}",
+                "Accept": "application/json",
+            }
+        return self._cached_headers
+
+    def _token_valid(self) -> bool:
+        """Return True if the access token is present and not about to expire."""
+        return bool(
+            self._access_token
+            and self._refresh_token
+            and self._token_expires
+            and time.time() < self._token_expires - 60
+        )
 
     async def _ensure_token(self) -> None:
         """Ensure access token is valid, or refresh/login as needed."""
-        if self._login_in_progress:
-            _LOGGER.debug("Login already in progress, skipping nested attempt")
+        if self._token_valid():
             return
 
+        # Concurrent callers wait here for a single login/refresh and then see
+        # the new token instead of each starting their own
+        async with self._token_lock:
+            if self._token_valid():
+                return
+            await self._renew_token()
+
+    async def _renew_token(self) -> None:
+        """Log in or refresh the access token; caller must hold the token lock."""
         if not self._access_token or not self._refresh_token:
             _LOGGER.debug("Token missing, initiating login")
-            self._login_in_progress = True
-            try:
-                success = await self.login()
-                if not success:
-                    msg = "Login failed"
-                    raise FenixTFTAuthError(msg)
-            finally:
-                self._login_in_progress = False
-            return
-
-        if self._token_expires and time.time() < self._token_expires - 60:
+            if not await self.login():
+                msg = "Login failed"
+                raise FenixTFTAuthError(msg)
             return
 
         _LOGGER.debug("Token expiring soon, refreshing access token")
-        url = f"{API_IDENTITY}/connect/token"
         data = {
             "grant_type": "refresh_token",
             "refresh_token": self._refresh_token,
             "client_id": CLIENT_ID,
         }
         async with self._session.post(
-            url, data=data, timeout=API_TIMEOUT_SECONDS
+            TOKEN_URL, data=data, timeout=REQUEST_TIMEOUT
         ) as resp:
             if resp.status != HTTP_OK:
                 _LOGGER.error("Token refresh failed: HTTP status %s", resp.status)
                 msg = f"Token refresh failed: {resp.status}"
                 raise FenixTFTAuthError(msg)
-            tokens = await resp.json()
+            tokens = await resp.json(loads=json_loads)
             if "access_token" not in tokens:
                 _LOGGER.error("Token refresh response missing access_token")
                 msg = "No access_token in response"
@@ -179,6 +280,82 @@ class FenixTFTApi:
             self._token_expires = time.time() + tokens.get("expires_in", 3600)
             _LOGGER.info("Access token refreshed successfully")
 
+    @asynccontextmanager
+    async def _api_request(
+        self,
+        method: str,
+        url: str,
+        request_timeout: aiohttp.ClientTimeout | None = REQUEST_TIMEOUT,
+        **kwargs: Any,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Send an authenticated API request, retrying once after a 401.
+
+        A 401 means the server no longer accepts the access token even though
+        it has not expired locally (clock skew or revocation), so the token is
+        renewed and the request repeated. Pass request_timeout=None to use the
+        session's default timeout.
+        """
+        if request_timeout is not None:
+            kwargs["timeout"] = request_timeout
+        # Skip the coroutine call entirely while the token is still fresh
+        if not self._token_valid():
+            await self._ensure_token()
+        token = self._access_token
+        resp = await self._session.request(
+            method, url, headers=self._headers(), **kwargs
+        )
+        if resp.status == HTTP_UNAUTHORIZED:
+            resp.release()
+            _LOGGER.debug("Access token rejected, renewing and retrying %s", url)
+            # Only invalidate if another request has not already renewed it
+            if self._access_token == token:
+                self._token_expires = None
+            await self._ensure_token()
+            resp = await self._session.request(
+                method, url, headers=self._headers(), **kwargs
+            )
+        try:
+            yield resp
+        finally:
+            resp.release()
+
+    async def _get_json(
+        self,
+        url: str,
+        description: str,
+        *,
+        empty_on_no_content: bool = False,
+        request_timeout: aiohttp.ClientTimeout | None = REQUEST_TIMEOUT,
+    ) -> Any:
+        """
+        GET an API endpoint and return its decoded JSON body.
+
+        Args:
+            url: Endpoint URL
+            description: Request description used in logs and errors
+            empty_on_no_content: Return an empty list on HTTP 204
+            request_timeout: Request timeout, None for the session default
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            FenixTFTApiError: If the response status is not 200
+
+        """
+        async with self._api_request(
+            "GET", url, request_timeout=request_timeout
+        ) as resp:
+            if empty_on_no_content and resp.status == HTTP_NO_CONTENT:
+                _LOGGER.debug("%s: no data (HTTP 204)", description)
+                return []
+            if resp.status != HTTP_OK:
+                _LOGGER.error("%s failed: HTTP status %s", description, resp.status)
+                msg = f"{description} failed: {resp.status}"
+                raise FenixTFTApiError(msg)
+            return await resp.json(loads=json_loads)
+
     async def _start_authorization(
         self,
     ) -> tuple[str | None, str | None, str | None, str | None]:
@@ -186,23 +363,14 @@ class FenixTFTApi:
         code_verifier, code_challenge = generate_pkce_pair()
         state = secrets.token_urlsafe(32)
         nonce = secrets.token_urlsafe(32)
-        auth_params = {
-            "client_id": CLIENT_ID,
-            "response_type": "code id_token",
-            "scope": SCOPES,
-            "redirect_uri": REDIRECT_URI,
-            "nonce": nonce,
-            "code_challenge": code_challenge,
-            "code_challenge_method": "S256",
-            "state": state,
-            "oemclient": "fenix",
-        }
+        # Per-login values are URL-safe base64 and need no further encoding
         auth_url = (
-            f"{API_IDENTITY}/connect/authorize?{urllib.parse.urlencode(auth_params)}"
+            f"{_AUTHORIZE_URL_PREFIX}&nonce={nonce}"
+            f"&code_challenge={code_challenge}&state={state}"
         )
 
         async with self._session.get(
-            auth_url, allow_redirects=False, timeout=API_TIMEOUT_SECONDS
+            auth_url, allow_redirects=False, timeout=REQUEST_TIMEOUT
         ) as resp:
             login_path = resp.headers.get("Location")
             if resp.status != HTTP_REDIRECT or not login_path:
@@ -223,31 +391,25 @@ class FenixTFTApi:
             )
             return None, None
 
-        async with self._session.get(
-            login_url, timeout=API_TIMEOUT_SECONDS
-        ) as login_page:
+        async with self._session.get(login_url, timeout=REQUEST_TIMEOUT) as login_page:
             if login_page.status != HTTP_OK:
                 _LOGGER.error(
                     "Failed to fetch login page: status=%s", login_page.status
                 )
                 return None, None
 
-            soup = BeautifulSoup(await login_page.text(), "html.parser")
-            csrf_input = soup.find("input", {"name": "__RequestVerificationToken"})
-            return_url_input = soup.find("input", {"name": "ReturnUrl"})
+            # Only the two matched values are decoded, not the whole page
+            page = await login_page.read()
 
-            if not (
-                csrf_input
-                and csrf_input.get("value")
-                and return_url_input
-                and return_url_input.get("value")
-            ):
-                _LOGGER.debug(
-                    "No CSRF token/ReturnUrl found, possibly cached session redirect"
-                )
-                return None, None
+        csrf_token = _input_value(_CSRF_INPUT_RE, page)
+        return_url = _input_value(_RETURN_URL_INPUT_RE, page)
+        if not (csrf_token and return_url):
+            _LOGGER.debug(
+                "No CSRF token/ReturnUrl found, possibly cached session redirect"
+            )
+            return None, None
 
-            return csrf_input["value"], return_url_input["value"]
+        return csrf_token, return_url
 
     async def _submit_login_form(
         self, login_url: str, return_url: str, csrf_token: str
@@ -264,7 +426,7 @@ class FenixTFTApi:
             login_url,
             data=login_data,
             allow_redirects=False,
-            timeout=API_TIMEOUT_SECONDS,
+            timeout=REQUEST_TIMEOUT,
         ) as resp:
             callback_path = resp.headers.get("Location")
             if resp.status != HTTP_REDIRECT or not callback_path:
@@ -284,7 +446,7 @@ class FenixTFTApi:
             async with self._session.get(
                 callback_url,
                 allow_redirects=False,
-                timeout=API_TIMEOUT_SECONDS,
+                timeout=REQUEST_TIMEOUT,
             ) as resp:
                 redirect_url = resp.headers.get("Location", callback_url)
                 parsed = urllib.parse.urlparse(redirect_url)
@@ -316,15 +478,15 @@ class FenixTFTApi:
             "client_id": CLIENT_ID,
         }
         async with self._session.post(
-            f"{API_IDENTITY}/connect/token",
+            TOKEN_URL,
             headers=token_headers,
             data=token_data,
-            timeout=API_TIMEOUT_SECONDS,
+            timeout=REQUEST_TIMEOUT,
         ) as resp:
             if resp.status != HTTP_OK:
                 msg = f"Token request failed: {resp.status}"
                 raise FenixTFTApiError(msg)
-            tokens = await resp.json()
+            tokens = await resp.json(loads=json_loads)
             self._access_token = tokens.get("access_token")
             self._refresh_token = tokens.get("refresh_token")
             if not (self._access_token and self._refresh_token):
@@ -379,153 +541,191 @@ class FenixTFTApi:
 
     async def get_userinfo(self) -> dict[str, Any]:
         """Retrieve user info from identity endpoint."""
-        await self._ensure_token()
         url = f"{API_IDENTITY}/connect/userinfo"
-        async with self._session.get(
-            url, headers=self._headers(), timeout=API_TIMEOUT_SECONDS
-        ) as resp:
-            if resp.status != HTTP_OK:
-                _LOGGER.error("Get userinfo failed: HTTP status %s", resp.status)
-                msg = f"Userinfo failed: {resp.status}"
-                raise FenixTFTApiError(msg)
-            data = await resp.json()
-            self._sub = data.get("sub")
-            if not self._sub:
-                _LOGGER.error("Userinfo response missing 'sub' field")
-                msg = "No 'sub' field in userinfo"
-                raise FenixTFTApiError(msg)
-            _LOGGER.debug("Retrieved user subscription ID: %s", self._sub)
-            return data
+        data = await self._get_json(url, "Get userinfo")
+        self._sub = data.get("sub")
+        if not self._sub:
+            _LOGGER.error("Userinfo response missing 'sub' field")
+            msg = "No 'sub' field in userinfo"
+            raise FenixTFTApiError(msg)
+        _LOGGER.debug("Retrieved user subscription ID: %s", self._sub)
+        return data
 
     async def get_installations(self) -> list[dict[str, Any]]:
-        """Return all installations associated with the user."""
+        """
+        Return all installations associated with the user.
+
+        Installation topology rarely changes, so a successful response is
+        reused for INSTALLATIONS_CACHE_TTL seconds across refreshes.
+        """
+        if (
+            self._installations_cache is not None
+            and time.monotonic() - self._installations_cache[0]
+            < INSTALLATIONS_CACHE_TTL
+        ):
+            return self._installations_cache[1]
+
         if not self._sub:
             await self.get_userinfo()
         url = f"{API_BASE}/businessmodule/v1/installations/admins/{self._sub}"
-        async with self._session.get(url, headers=self._headers()) as resp:
-            if resp.status != HTTP_OK:
-                _LOGGER.error("Get installations failed: HTTP status %s", resp.status)
-                msg = f"Installations failed: {resp.status}"
-                raise FenixTFTApiError(msg)
-            installations = await resp.json()
-            _LOGGER.debug(
-                "Retrieved %d installation(s)",
-                len(installations) if installations else 0,
-            )
-            return installations
+        try:
+            installations = await self._get_json(url, "Get installations")
+        except (FenixTFTApiError, TimeoutError, aiohttp.ClientError):
+            # Never serve a stale topology after the backend reported an error
+            self._installations_cache = None
+            raise
+        _LOGGER.debug(
+            "Retrieved %d installation(s)",
+            len(installations) if installations else 0,
+        )
+        self._installations_cache = (time.monotonic(), installations)
+        return installations
 
     async def get_device_properties(self, device_id: str) -> dict[str, Any]:
         """Fetch device properties from configuration endpoint."""
-        await self._ensure_token()
         url = (
             f"{API_BASE}/iotmanagement/v1/configuration/"
             f"{device_id}/{device_id}/v1/content/"
         )
-        async with self._session.get(url, headers=self._headers()) as resp:
-            if resp.status != HTTP_OK:
-                _LOGGER.error(
-                    "Get device properties failed for device %s: HTTP status %s",
-                    device_id,
-                    resp.status,
-                )
-                msg = f"Device props failed: {resp.status}"
-                raise FenixTFTApiError(msg)
-            return await resp.json()
+        return await self._get_json(url, f"Get device properties for {device_id}")
 
-    async def get_devices(self) -> list[dict[str, Any]]:
-        """Retrieve all devices with their current state."""
+    async def _fetch_device(  # noqa: PLR0913
+        self,
+        semaphore: asyncio.Semaphore,
+        inst_name: str,
+        inst_id: str | None,
+        room_id: str | None,
+        dev_id: str,
+        energy_semaphore: asyncio.Semaphore | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Fetch and decode a single device's properties with semaphore control.
+
+        When energy_semaphore is given, the device's daily energy is fetched
+        right after its properties instead of in a second pass over all devices.
+        """
+        async with semaphore:  # Limit concurrent requests
+            try:
+                props = await self.get_device_properties(dev_id)
+            except (FenixTFTApiError, TimeoutError, aiohttp.ClientError):
+                _LOGGER.exception("Failed to fetch properties for device %s", dev_id)
+                return None
+
+        # API Field Mapping:
+        # Cm = Current preset/operating mode
+        #      (0=Off, 1=Holidays, 2=Program, 4=Defrost, 5=Boost,
+        #      6=Manual)
+        # Hs = HVAC state - dual purpose field:
+        #      - Normal mode: heating status (0=idle, 1=heating, 2=off)
+        #      - Holiday mode (Cm=1): holiday mode type
+        #        (1=Off, 2=Reduce/Eco, 5=Defrost, 8=Sunday)
+        # H1 = Holiday schedule start date/time (DD/MM/YYYY HH:MM:SS)
+        # H2 = Holiday schedule end date/time (DD/MM/YYYY HH:MM:SS)
+        # H3 = Holiday mode array [mode, 0, 0, ...]
+        #      Often all zeros when using manual holiday activation
+        # H4 = Currently active holiday mode - real-time indicator
+        #      (0=no active holiday, 1=Off, 2=Reduce/Eco, 5=Defrost,
+        #      8=Sunday). This is the PRIMARY indicator for active
+        #      holiday state, regardless of Cm value.
+
+        preset_mode_val = _prop_value(props, "Cm")
+        hvac_state_val = _prop_value(props, "Hs")
+        h1_val = _prop_value(props, "H1")
+        h2_val = _prop_value(props, "H2")
+        h3_val = _prop_value(props, "H3")
+        h4_val = _prop_value(props, "H4")  # Active holiday mode
+
+        # Parse H3 array to get holiday_mode (first element if present)
+        holiday_mode = (
+            h3_val[0] if h3_val and isinstance(h3_val, list) else HOLIDAY_MODE_NONE
+        )
+
+        _LOGGER.debug(
+            "Device %s API fields: Cm=%s, Hs=%s, H1=%s, H2=%s, "
+            "H3=%s, H4=%s, parsed_holiday_mode=%s",
+            dev_id,
+            preset_mode_val,
+            hvac_state_val,
+            h1_val,
+            h2_val,
+            h3_val,
+            h4_val,
+            holiday_mode,
+        )
+        device = {
+            "id": dev_id,
+            "name": _prop_value(props, "Rn", "Unnamed Device"),
+            "software": _prop_value(props, "Sv"),
+            "type": _prop_value(props, "Ty"),
+            "installation": inst_name,
+            "installation_id": inst_id,
+            "room_id": room_id,
+            "target_temp": decode_temp_from_entry(props.get("Ma")),
+            "current_temp": decode_temp_from_entry(props.get("At")),
+            "floor_temp": decode_temp_from_entry(props.get("bo")),
+            # hvac_action: Hs value (heating status OR holiday mode)
+            "hvac_action": hvac_state_val,
+            "preset_mode": preset_mode_val,  # Cm value
+            "holiday_start": h1_val,  # H1 value
+            "holiday_end": h2_val,  # H2 value
+            "holiday_mode": holiday_mode,  # H3[0] value
+            "active_holiday_mode": HOLIDAY_MODE_NONE
+            if h4_val is None
+            else h4_val,  # H4 value - real-time indicator
+            "holiday_target_temp": decode_temp_from_entry(
+                props.get("Sp")
+            ),  # Sp value - active target when in holiday mode
+        }
+        if energy_semaphore is None:
+            return device
+        return await self._fetch_device_energy_data(energy_semaphore, device)
+
+    async def get_devices(
+        self, *, include_energy: bool = False
+    ) -> list[dict[str, Any]]:
+        """Retrieve all devices with their current state, optionally with energy."""
         _LOGGER.debug("Fetching all devices")
         try:
             installations = await self.get_installations()
+            # Refresh the token once up front so the concurrent property
+            # requests below do not each race to refresh it
+            await self._ensure_token()
         except FenixTFTApiError:
             _LOGGER.exception("Failed to fetch installations")
             return []
 
-        devices = []
+        # Create semaphore to limit concurrent property requests
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PROPERTY_REQUESTS)
+        energy_semaphore = (
+            asyncio.Semaphore(MAX_CONCURRENT_ENERGY_REQUESTS)
+            if include_energy
+            else None
+        )
+        device_tasks = []
         for inst in installations:
             inst_name = inst.get("Il", "Fenix TFT")
             inst_id = inst.get("id")  # Get installation ID
             _LOGGER.debug("Processing installation: %s (ID: %s)", inst_name, inst_id)
             for room in inst.get("rooms", []):
                 room_id = room.get("Zn")  # Get room ID (Zn field)
-                for dev in room.get("devices", []):
-                    dev_id = dev.get("Id_deviceId")
-                    try:
-                        props = await self.get_device_properties(dev_id)
-
-                        # API Field Mapping:
-                        # Cm = Current preset/operating mode
-                        #      (0=Off, 1=Holidays, 2=Program, 4=Defrost, 5=Boost,
-                        #      6=Manual)
-                        # Hs = HVAC state - dual purpose field:
-                        #      - Normal mode: heating status (0=idle, 1=heating, 2=off)
-                        #      - Holiday mode (Cm=1): holiday mode type
-                        #        (1=Off, 2=Reduce/Eco, 5=Defrost, 8=Sunday)
-                        # H1 = Holiday schedule start date/time (DD/MM/YYYY HH:MM:SS)
-                        # H2 = Holiday schedule end date/time (DD/MM/YYYY HH:MM:SS)
-                        # H3 = Holiday mode array [mode, 0, 0, ...]
-                        #      Often all zeros when using manual holiday activation
-                        # H4 = Currently active holiday mode - real-time indicator
-                        #      (0=no active holiday, 1=Off, 2=Reduce/Eco, 5=Defrost,
-                        #      8=Sunday). This is the PRIMARY indicator for active
-                        #      holiday state, regardless of Cm value.
-
-                        preset_mode_val = props.get("Cm", {}).get("value")
-                        hvac_state_val = props.get("Hs", {}).get("value")
-                        h1_val = props.get("H1", {}).get("value")
-                        h2_val = props.get("H2", {}).get("value")
-                        h3_val = props.get("H3", {}).get("value")
-                        h4_val = props.get("H4", {}).get("value")  # Active holiday mode
-
-                        # Parse H3 array to get holiday_mode (first element if present)
-                        holiday_mode = (
-                            h3_val[0]
-                            if h3_val and isinstance(h3_val, list)
-                            else HOLIDAY_MODE_NONE
-                        )
+                device_tasks.extend(
+                    self._fetch_device(
+                        semaphore,
+                        inst_name,
+                        inst_id,
+                        room_id,
+                        dev.get("Id_deviceId"),
+                        energy_semaphore,
+                    )
+                    for dev in room.get("devices", [])
+                )
 
-                        _LOGGER.debug(
-                            "Device %s API fields: Cm=%s, Hs=%s, H1=%s, H2=%s, "
-                            "H3=%s, H4=%s, parsed_holiday_mode=%s",
-                            dev_id,
-                            preset_mode_val,
-                            hvac_state_val,
-                            h1_val,
-                            h2_val,
-                            h3_val,
-                            h4_val,
-                            holiday_mode,
-                        )
-                        device_data = {
-                            "id": dev_id,
-                            "name": props.get("Rn", {}).get("value", "Unnamed Device"),
-                            "software": props.get("Sv", {}).get("value"),
-                            "type": props.get("Ty", {}).get("value"),
-                            "installation": inst_name,
-                            "installation_id": inst_id,
-                            "room_id": room_id,
-                            "target_temp": decode_temp_from_entry(props.get("Ma")),
-                            "current_temp": decode_temp_from_entry(props.get("At")),
-                            "floor_temp": decode_temp_from_entry(props.get("bo")),
-                            # hvac_action: Hs value (heating status OR holiday mode)
-                            "hvac_action": hvac_state_val,
-                            "preset_mode": preset_mode_val,  # Cm value
-                            "holiday_start": h1_val,  # H1 value
-                            "holiday_end": h2_val,  # H2 value
-                            "holiday_mode": holiday_mode,  # H3[0] value
-                            "active_holiday_mode": HOLIDAY_MODE_NONE
-                            if h4_val is None
-                            else h4_val,  # H4 value - real-time indicator
-                            "holiday_target_temp": decode_temp_from_entry(
-                                props.get("Sp")
-                            ),  # Sp value - active target when in holiday mode
-                        }
-                        devices.append(device_data)
-                    except FenixTFTApiError:
-                        _LOGGER.exception(
-                            "Failed to fetch properties for device %s", dev_id
-                        )
-                        continue
+        # Results keep installation/room/device order; failed devices are None
+        devices = [
+            device
+            for device in await asyncio.gather(*device_tasks)
+            if device is not None
+        ]
 
         # Update all devices after fetching
         await self.update_all_devices(devices)
@@ -547,16 +747,14 @@ class FenixTFTApi:
         4xx and other non-retriable errors are logged at error level.
         """
         for attempt in range(max_retries + 1):
-            async with self._session.put(
-                url, headers=self._headers(), json=payload
-            ) as resp:
+            async with self._api_request("PUT", url, json=payload) as resp:
                 status = resp.status
                 body_text = await resp.text()
                 truncated_body = body_text[:512]
 
                 if HTTP_OK <= status < HTTP_SUCCESS_MAX:
                     try:
-                        return json.loads(body_text)
+                        return json_loads(body_text)
                     except Exception as err:
                         _LOGGER.exception(
                             "%s (HTTP %s) invalid JSON response. Body: %s",
@@ -616,7 +814,6 @@ class FenixTFTApi:
         self, device_id: str, temp_c: float
     ) -> dict[str, Any]:
         """Set target temperature for a device."""
-        await self._ensure_token()
         raw_val = encode_temp_to_entry(temp_c)
         payload = {
             "Id_deviceId": device_id,
@@ -642,7 +839,6 @@ class FenixTFTApi:
         self, device_id: str, preset_mode: int
     ) -> dict[str, Any]:
         """Set device preset mode (comfort, eco, etc.)."""
-        await self._ensure_token()
         if preset_mode not in VALID_PRESET_MODES:
             _LOGGER.error(
                 "Invalid preset mode %s for device %s (valid: %s)",
@@ -677,27 +873,43 @@ class FenixTFTApi:
         """Update all devices by triggering updates for each installation."""
         _LOGGER.debug("Triggering updates for all devices")
         # Trigger updates for each unique installation
-        installation_ids = {
-            device.get("installation_id")
-            for device in devices
-            if device.get("installation_id")
-        }
-        for installation_id in installation_ids:
-            try:
-                await self.trigger_device_updates(installation_id)
-            except FenixTFTApiError as err:
-                # Do not fail the entire refresh if the backend rejects the
-                # trigger request (often returns sporadic 500 responses). We
-                # already have fresh device data, so treat this as best effort.
+        installation_ids = list(
+            {
+                device.get("installation_id")
+                for device in devices
+                if device.get("installation_id")
+            }
+        )
+        # Installations are independent, so trigger them concurrently
+        results = await asyncio.gather(
+            *(
+                self.trigger_device_updates(installation_id)
+                for installation_id in installation_ids
+            ),
+            return_exceptions=True,
+        )
+        unexpected: BaseException | None = None
+        for installation_id, result in zip(installation_ids, results, strict=True):
+            # Do not fail the entire refresh if the backend rejects or times
+            # out the trigger request (often returns sporadic 500 responses).
+            # We already have fresh device data, so treat this as best effort.
+            if isinstance(
+                result, (FenixTFTApiError, TimeoutError, aiohttp.ClientError)
+            ):
                 _LOGGER.warning(
                     "Skipping failed device update trigger for installation %s: %s",
                     installation_id,
-                    err,
+                    result,
                 )
+            elif isinstance(result, BaseException) and unexpected is None:
+                unexpected = result
+        # Anything else, including cancellation, still fails the refresh once
+        # the expected failures of the other installations have been logged
+        if unexpected is not None:
+            raise unexpected
 
     async def trigger_device_updates(self, installation_id: str) -> dict[str, Any]:
         """Trigger device updates for a specific installation."""
-        await self._ensure_token()
         payload = {
             "A1": self._sub,
             "In": installation_id,
@@ -718,8 +930,6 @@ class FenixTFTApi:
         subscription_id: str,
     ) -> list[dict[str, Any]]:
         """Get energy consumption data for a specific room/subscription."""
-        await self._ensure_token()
-
         # Get start of today in Home Assistant's configured timezone
         # dt_util.start_of_local_day() returns midnight in HA's configured
         # timezone, which may differ from the host system's timezone
@@ -728,11 +938,8 @@ class FenixTFTApi:
 
         # End: clamp to now to avoid querying future time (which some backends
         # treat as no data) while still bounded by end of day
-        end_of_day_local = dt_util.start_of_local_day() + dt_util.dt.timedelta(
-            days=1, microseconds=-1
-        )
-        now_local = dt_util.now()
-        end_local = min(end_of_day_local, now_local)
+        end_of_day_local = start_local + timedelta(days=1, microseconds=-1)
+        end_local = min(end_of_day_local, dt_util.now())
 
         # Convert to UTC for API
         start_date = start_local.astimezone(UTC)
@@ -753,25 +960,12 @@ class FenixTFTApi:
             end_date.isoformat(),
         )
 
-        async with self._session.get(url, headers=self._headers()) as resp:
-            if resp.status == HTTP_NO_CONTENT:
-                _LOGGER.debug(
-                    "No energy data: installation_id=%s, room_id=%s",
-                    installation_id,
-                    room_id,
-                )
-                return []
-            if resp.status != HTTP_OK:
-                _LOGGER.error(
-                    "Get energy consumption failed: installation_id=%s, room_id=%s, "
-                    "HTTP status %s",
-                    installation_id,
-                    room_id,
-                    resp.status,
-                )
-                msg = f"Failed to get energy consumption: {resp.status}"
-                raise FenixTFTApiError(msg)
-            return await resp.json()
+        return await self._get_json(
+            url,
+            f"Get energy consumption for installation_id={installation_id}, "
+            f"room_id={room_id}",
+            empty_on_no_content=True,
+        )
 
     async def get_room_historical_energy(  # noqa: PLR0913
         self,
@@ -804,12 +998,8 @@ class FenixTFTApi:
         start_date = dt_util.as_utc(start_date)
         end_date = dt_util.as_utc(end_date)
 
-        await self._ensure_token()
-
-        url = (
-            f"{API_BASE}/DataProcessing/v1/metricsAggregat/consommation/room/"
-            f"{installation_id}/{room_id}/{subscription_id}/{period}/Wc/"
-            f"{_format_api_date(start_date)}/{_format_api_date(end_date)}"
+        url = _build_energy_consumption_url(
+            installation_id, room_id, subscription_id, start_date, end_date, period
         )
 
         _LOGGER.debug(
@@ -822,28 +1012,13 @@ class FenixTFTApi:
             end_date.isoformat(),
         )
 
-        async with self._session.get(url, headers=self._headers()) as resp:
-            if resp.status == HTTP_NO_CONTENT:
-                _LOGGER.debug(
-                    "No historical energy data available: installation_id=%s, "
-                    "room_id=%s, period=%s",
-                    installation_id,
-                    room_id,
-                    period,
-                )
-                return []
-            if resp.status != HTTP_OK:
-                _LOGGER.error(
-                    "Get historical energy failed: installation_id=%s, room_id=%s, "
-                    "period=%s, HTTP status %s",
-                    installation_id,
-                    room_id,
-                    period,
-                    resp.status,
-                )
-                msg = f"Failed to get historical energy data: {resp.status}"
-                raise FenixTFTApiError(msg)
-            return await resp.json()
+        return await self._get_json(
+            url,
+            f"Get historical energy for installation_id={installation_id}, "
+            f"room_id={room_id}, period={period}",
+            empty_on_no_content=True,
+            request_timeout=None,
+        )
 
     async def _fetch_device_energy_data(
         self,
@@ -877,17 +1052,14 @@ class FenixTFTApi:
 
                 # Process the energy data - use processedDataWithAggregator
                 if energy_data and isinstance(energy_data, list):
-                    total_consumption = 0
-                    for item in energy_data:
-                        if isinstance(item, dict):
-                            consumption_value = item.get(
-                                "processedDataWithAggregator", 0
-                            )
-                            total_consumption += consumption_value
-                    device["daily_energy_consumption"] = total_consumption
+                    device["daily_energy_consumption"] = sum(
+                        item.get("processedDataWithAggregator", 0)
+                        for item in energy_data
+                        if isinstance(item, dict)
+                    )
                 else:
                     device["daily_energy_consumption"] = 0
-            except FenixTFTApiError as err:
+            except (FenixTFTApiError, TimeoutError, aiohttp.ClientError) as err:
                 _LOGGER.debug(
                     "Failed to fetch energy data for device %s: %s", device_id, err
                 )
@@ -898,28 +1070,8 @@ class FenixTFTApi:
 
     async def fetch_devices_with_energy_data(self) -> list[dict[str, Any]]:
         """Retrieve all devices with their current state and energy consumption data."""
-        devices = await self.get_devices()
-
-        # Create semaphore to limit concurrent energy data requests
-        semaphore = asyncio.Semaphore(MAX_CONCURRENT_ENERGY_REQUESTS)
-
-        # Fetch energy data for all devices concurrently
-        energy_tasks = [
-            self._fetch_device_energy_data(semaphore, device) for device in devices
-        ]
-
-        # Wait for all energy data fetches to complete
-        updated_devices = await asyncio.gather(*energy_tasks, return_exceptions=True)
-
-        # Filter out any exceptions and return valid devices
-        result_devices = []
-        for device in updated_devices:
-            if isinstance(device, Exception):
-                _LOGGER.warning("Energy data fetch failed: %s", device)
-                continue
-            result_devices.append(device)
-
-        return result_devices
+        # Energy requests are pipelined behind each device's property request
+        return await self.get_devices(include_energy=True)
 
     async def set_holiday_schedule(
         self,
@@ -944,8 +1096,6 @@ class FenixTFTApi:
             FenixTFTApiError: If the API request fails
 
         """
-        await self._ensure_token()
-
         # Format dates as DD/MM/YYYY HH:MM:SS
         start_str = start_date.strftime("%d/%m/%Y %H:%M:%S")
         end_str = end_date.strftime("%d/%m/%Y %H:%M:%S")
@@ -1006,29 +1156,10 @@ class FenixTFTApi:
             FenixTFTApiError: If the API request fails
 
         """
-        await self._ensure_token()
-
         payload = {
             "In": installation_id,
             "A1": self._sub,
-            "data": [
-                {
-                    "timestamp": None,
-                    "wattsType": "H1",
-                    "wattsTypeValue": HOLIDAY_EPOCH_DATE,
-                },
-                {
-                    "timestamp": None,
-                    "wattsType": "H2",
-                    "wattsTypeValue": HOLIDAY_EPOCH_DATE,
-                },
-                {
-                    "timestamp": None,
-                    "wattsType": "H3",
-                    # Reset holiday mode to none (flat list form like schedule set)
-                    "wattsTypeValue": [0, 0, 0],
-                },
-            ],
+            "data": list(_HOLIDAY_CANCEL_DATA),
         }
 
         url = f"{API_BASE}/iotmanagement/v1/devices/installationcontroljob"
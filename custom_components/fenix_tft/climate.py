@@ -96,8 +96,8 @@ async def async_setup_entry(
     """Set up Fenix TFT climate entities from a config entry."""
     # Get runtime data stored by the integration setup
     data = entry.runtime_data
-    coordinator = data["coordinator"]
-    api = data["api"]
+    coordinator = data.coordinator
+    api = data.api
 
     # Create climate entities for each device found by the coordinator
     entities = [
@@ -312,7 +312,7 @@ class FenixTFTClimate(FenixTFTEntity, ClimateEntity):
             )
             # Request fresh data from coordinator to update UI
             await self.coordinator.async_request_refresh()
-        except (aiohttp.ClientError, FenixTFTApiError):
+        except (aiohttp.ClientError, FenixTFTApiError, TimeoutError):
             _LOGGER.exception(
                 "Failed to set temperature for device %s to %.1f°C",
                 self._device_id,
@@ -360,7 +360,7 @@ class FenixTFTClimate(FenixTFTEntity, ClimateEntity):
                 self._device_id,
                 hvac_mode,
             )
-        except (aiohttp.ClientError, FenixTFTApiError):
+        except (aiohttp.ClientError, FenixTFTApiError, TimeoutError):
             _LOGGER.exception(
                 "Failed to set HVAC mode for device %s to %s",
                 self._device_id,
@@ -416,7 +416,7 @@ class FenixTFTClimate(FenixTFTEntity, ClimateEntity):
                 self._device_id,
                 preset_mode,
             )
-        except (aiohttp.ClientError, FenixTFTApiError):
+        except (aiohttp.ClientError, FenixTFTApiError, TimeoutError):
             _LOGGER.exception(
                 "Failed to set preset mode for device %s to %s",
                 self._device_id,
@@ -1,10 +1,11 @@
 """Constants for the fenix_tft custom component."""
 
-from collections.abc import Sequence
 from typing import Final
 
+from homeassistant.const import Platform
+
 DOMAIN: Final[str] = "fenix_tft"
-PLATFORMS: Final[Sequence[str]] = ("climate", "sensor")
+PLATFORMS: Final[tuple[Platform, ...]] = (Platform.CLIMATE, Platform.SENSOR)
 
 POLLING_INTERVAL: Final[int] = 300  # Polling interval in seconds
 OPTIMISTIC_UPDATE_DURATION: Final[int] = 10  # Optimistic update duration (seconds)
@@ -32,6 +33,7 @@ HTTP_NO_CONTENT: Final[int] = 204
 HTTP_REDIRECT: Final[int] = 302
 HTTP_SUCCESS_MAX: Final[int] = 300  # Exclusive upper bound for 2xx range
 HTTP_CLIENT_ERROR: Final[int] = 400  # Inclusive lower bound for 4xx range
+HTTP_UNAUTHORIZED: Final[int] = 401
 HTTP_CLIENT_ERROR_MAX: Final[int] = 500  # Exclusive upper bound for 4xx range
 HTTP_SERVER_ERROR: Final[int] = 500  # Threshold for server-side errors (5xx)
 
@@ -113,8 +115,12 @@ HOLIDAY_DATE_FORMAT: Final[str] = "%d/%m/%Y %H:%M:%S"
 # Exception message for holiday mode lock
 HOLIDAY_LOCKED_MSG: Final[str] = "Holiday schedule active; controls locked"
 
-# Delay (seconds) to wait after holiday schedule changes before refresh
+# Delay (seconds) the backend usually needs to apply holiday schedule changes.
+# After a change the coordinator is polled until devices report the new mode,
+# giving up after HOLIDAY_PROPAGATION_TIMEOUT seconds
 HOLIDAY_PROPAGATION_DELAY: Final[int] = 5
+HOLIDAY_POLL_MIN_INTERVAL: Final[float] = 1.0  # First poll; doubles each retry
+HOLIDAY_PROPAGATION_TIMEOUT: Final[int] = HOLIDAY_PROPAGATION_DELAY
 
 # Service names
 SERVICE_SET_HOLIDAY_SCHEDULE: Final[str] = "set_holiday_schedule"
@@ -131,6 +137,7 @@ ATTR_ENERGY_ENTITY: Final[str] = "energy_entity"
 
 # Historical data import configuration
 API_RATE_LIMIT_DELAY: Final[int] = 1  # Delay in seconds between API calls
+HISTORICAL_IMPORT_MAX_CONCURRENCY: Final[int] = 4  # Parallel history chunk requests
 
 # Temperature bounds for the thermostat
 TEMP_MIN: Final[float] = 5.0  # Minimum settable temperature (°C)
@@ -56,6 +56,9 @@ class FenixTFTCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
     _optimistic_updates: dict[str, tuple[int, int, float]]
     _consecutive_failures: int
     _unavailable_logged: bool
+    _devices_by_id: dict[str, dict[str, Any]]
+    _installations: dict[str, str | None]
+    _indexed_data: list[dict[str, Any]] | None
 
     def __init__(
         self, hass: HomeAssistant, api: FenixTFTApi, config_entry: ConfigEntry
@@ -72,6 +75,9 @@ class FenixTFTCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
         self._optimistic_updates: dict[str, tuple[int, int, float]] = {}
         self._consecutive_failures: int = 0
         self._unavailable_logged: bool = False
+        self._devices_by_id: dict[str, dict[str, Any]] = {}
+        self._installations: dict[str, str | None] = {}
+        self._indexed_data: list[dict[str, Any]] | None = None
 
     async def _async_update_data(self) -> list[dict[str, Any]]:
         """Fetch data from Fenix TFT API."""
@@ -136,6 +142,11 @@ class FenixTFTCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
         """Overlay in-flight optimistic updates onto freshly fetched device data."""
         current_time: float = self.hass.loop.time()
         expired_updates: list[str] = []
+        fresh_by_id: dict[str, dict[str, Any]] = (
+            {device["id"]: device for device in fresh_data if device.get("id")}
+            if self._optimistic_updates
+            else {}
+        )
 
         for device_id, (preset_mode, hvac_action, timestamp) in list(
             self._optimistic_updates.items()
@@ -143,18 +154,16 @@ class FenixTFTCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
             if current_time - timestamp > OPTIMISTIC_UPDATE_DURATION:
                 expired_updates.append(device_id)
                 continue
-            for device in fresh_data:
-                if device.get("id") == device_id:
-                    _LOGGER.debug(
-                        "Preserving optimistic update for device %s: "
-                        "preset_mode=%s, hvac_action=%s",
-                        device_id,
-                        preset_mode,
-                        hvac_action,
-                    )
-                    device["preset_mode"] = preset_mode
-                    device["hvac_action"] = hvac_action
-                    break
+            if (device := fresh_by_id.get(device_id)) is not None:
+                _LOGGER.debug(
+                    "Preserving optimistic update for device %s: "
+                    "preset_mode=%s, hvac_action=%s",
+                    device_id,
+                    preset_mode,
+                    hvac_action,
+                )
+                device["preset_mode"] = preset_mode
+                device["hvac_action"] = hvac_action
 
         for device_id in expired_updates:
             _LOGGER.debug(
@@ -177,39 +186,67 @@ class FenixTFTCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
             )
             return
 
-        device_found = False
-        for device in self.data:
-            if device.get("id") == device_id:
-                target_temp: float | None = device.get("target_temp")
-                current_temp: float | None = device.get("current_temp")
-                predicted_hvac_action: int = _predict_hvac_action(
-                    preset_mode, target_temp, current_temp
-                )
-                current_time: float = self.hass.loop.time()
-                self._optimistic_updates[device_id] = (
-                    preset_mode,
-                    predicted_hvac_action,
-                    current_time,
-                )
-                device["preset_mode"] = preset_mode
-                device["hvac_action"] = predicted_hvac_action
-                device_found = True
-                _LOGGER.debug(
-                    "Optimistic update applied for device %s: preset_mode=%s, "
-                    "predicted_hvac_action=%s (target=%.1f, current=%.1f)",
-                    device_id,
-                    preset_mode,
-                    predicted_hvac_action,
-                    target_temp if target_temp is not None else float("nan"),
-                    current_temp if current_temp is not None else float("nan"),
-                )
-                break
-
-        if not device_found:
+        device = self.get_device(device_id)
+        if device is None:
             _LOGGER.warning(
                 "Device %s not found in coordinator data for optimistic update",
                 device_id,
             )
+            return
+
+        target_temp: float | None = device.get("target_temp")
+        current_temp: float | None = device.get("current_temp")
+        predicted_hvac_action: int = _predict_hvac_action(
+            preset_mode, target_temp, current_temp
+        )
+        current_time: float = self.hass.loop.time()
+        self._optimistic_updates[device_id] = (
+            preset_mode,
+            predicted_hvac_action,
+            current_time,
+        )
+        device["preset_mode"] = preset_mode
+        device["hvac_action"] = predicted_hvac_action
+        _LOGGER.debug(
+            "Optimistic update applied for device %s: preset_mode=%s, "
+            "predicted_hvac_action=%s (target=%.1f, current=%.1f)",
+            device_id,
+            preset_mode,
+            predicted_hvac_action,
+            target_temp if target_temp is not None else float("nan"),
+            current_temp if current_temp is not None else float("nan"),
+        )
+
+    def _ensure_indexes(self) -> None:
+        """
+        Rebuild the device and installation indexes if ``self.data`` changed.
+
+        Indexes are rebuilt lazily whenever ``self.data`` is replaced, so
+        lookups stay O(1) without scanning the device list on every call.
+        """
+        if self._indexed_data is self.data:
+            return
+        devices = self.data or ()
+        self._devices_by_id = {
+            device["id"]: device for device in devices if device.get("id")
+        }
+        self._installations = {
+            device["installation_id"]: device.get("installation")
+            for device in devices
+            if device.get("installation_id")
+        }
+        self._indexed_data = self.data
+
+    def get_device(self, device_id: str) -> dict[str, Any] | None:
+        """Return the device dict for a device ID from the current coordinator data."""
+        self._ensure_indexes()
+        return self._devices_by_id.get(device_id)
+
+    @property
+    def installations(self) -> dict[str, str | None]:
+        """Return installation names keyed by installation ID."""
+        self._ensure_indexes()
+        return self._installations
 
     @property
     def pending_optimistic_update_count(self) -> int:
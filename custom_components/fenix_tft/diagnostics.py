@@ -33,7 +33,7 @@ async def async_get_config_entry_diagnostics(
     entry: FenixTFTConfigEntry,
 ) -> dict[str, Any]:
     """Return diagnostics for a Fenix TFT config entry."""
-    coordinator = entry.runtime_data["coordinator"]
+    coordinator = entry.runtime_data.coordinator
 
     devices_info = [
         {
@@ -24,8 +24,19 @@ def _get_device_name(dev: dict[str, Any] | None) -> str:
     return installation or room or "Fenix TFT"
 
 
+def device_id_from_unique_id(unique_id: str) -> str:
+    """Return the Fenix device ID encoded in an entity unique ID."""
+    return unique_id.partition("_")[0]
+
+
 class FenixTFTEntity(CoordinatorEntity[FenixTFTCoordinator]):
-    """Base class for Fenix TFT entities."""
+    """
+    Base class for Fenix TFT entities.
+
+    Unique IDs must be the Fenix device ID, optionally followed by
+    ``_<suffix>``, so services can map entities to devices without a device
+    registry lookup (see ``device_id_from_unique_id``).
+    """
 
     _attr_has_entity_name = True
 
@@ -52,10 +63,7 @@ class FenixTFTEntity(CoordinatorEntity[FenixTFTCoordinator]):
     @property
     def _device(self) -> dict[str, Any] | None:
         """Return the device dict for this entity from coordinator data."""
-        return next(
-            (d for d in self.coordinator.data if d["id"] == self._device_id),
-            None,
-        )
+        return self.coordinator.get_device(self._device_id)
 
     @property
     def available(self) -> bool:
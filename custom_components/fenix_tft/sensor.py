@@ -43,7 +43,7 @@ async def async_setup_entry(
 ) -> None:
     """Set up Fenix TFT sensor entities from a config entry."""
     data = entry.runtime_data
-    coordinator = data["coordinator"]
+    coordinator = data.coordinator
 
     entities = []
 
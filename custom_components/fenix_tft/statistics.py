@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+from datetime import timedelta
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -94,7 +96,7 @@ async def get_first_statistic_time(
             search_windows_days = [30, 90, 180, 365, 730, 1825]
 
             for days_back in search_windows_days:
-                start_time = now - dt_util.dt.timedelta(days=days_back)
+                start_time = now - timedelta(days=days_back)
 
                 stats = statistics_during_period(
                     hass,
@@ -153,8 +155,8 @@ def create_energy_statistic_metadata(
 
     """
     # Create separate statistic_id for historical data by appending _history
-    # Remove the 'sensor.' prefix for cleaner external statistic names
-    clean_id = entity_id.replace("sensor.", "")
+    # Remove the domain prefix (e.g. 'sensor.') for cleaner external statistic names
+    clean_id = entity_id.partition(".")[2]
     history_statistic_id = f"fenix_tft:{clean_id}_history"
     history_entity_name = f"{entity_name} (History)"
 
@@ -198,35 +200,40 @@ def convert_energy_api_data_to_statistics(
 
     statistics = []
     cumulative_sum = starting_sum
-
-    # Sort data by timestamp to ensure chronological order
-    sorted_data = sorted(
-        api_data,
-        key=lambda x: x.get("startDateOfMetric", ""),
-    )
-
-    for item in sorted_data:
+    # Checked once: per-point debug logging dominates large hourly imports
+    debug_points = _LOGGER.isEnabledFor(logging.DEBUG)
+    # Bound locally: looked up once per point in the loop below
+    parse_datetime = dt_util.parse_datetime
+    utc = dt_util.UTC
+
+    # Drop malformed points first so the remainder can be sorted by key in C
+    sorted_data = []
+    for item in api_data:
         if not isinstance(item, dict):
             continue
-
-        # Parse start date
-        start_date_str = item.get("startDateOfMetric")
-        if not start_date_str:
+        if not item.get("startDateOfMetric"):
             _LOGGER.warning("Missing startDateOfMetric in energy data: %s", item)
             continue
+        sorted_data.append(item)
+
+    # Sort data by timestamp to ensure chronological order
+    sorted_data.sort(key=itemgetter("startDateOfMetric"))
+
+    for item in sorted_data:
+        start_date_str = item["startDateOfMetric"]
 
         try:
             # Parse ISO format date string and ensure UTC timezone
-            start_dt = dt_util.parse_datetime(start_date_str)
+            start_dt = parse_datetime(start_date_str)
             if start_dt is None:
                 _LOGGER.warning("Failed to parse date: %s", start_date_str)
                 continue
 
             # Ensure UTC timezone
             if start_dt.tzinfo is None:
-                start_dt = start_dt.replace(tzinfo=dt_util.UTC)
+                start_dt = start_dt.replace(tzinfo=utc)
             else:
-                start_dt = start_dt.astimezone(dt_util.UTC)
+                start_dt = start_dt.astimezone(utc)
 
             # Get energy value (in Wh) for this period
             period_value = item.get("sum", 0)
@@ -249,12 +256,13 @@ def convert_energy_api_data_to_statistics(
 
             cumulative_sum += period_value
 
-            _LOGGER.debug(
-                "Energy data point: time=%s, period=%s, cumulative=%s",
-                start_dt,
-                period_value,
-                cumulative_sum,
-            )
+            if debug_points:
+                _LOGGER.debug(
+                    "Energy data point: time=%s, period=%s, cumulative=%s",
+                    start_dt,
+                    period_value,
+                    cumulative_sum,
+                )
 
             statistics.append(
                 StatisticData(
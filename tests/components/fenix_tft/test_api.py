@@ -0,0 +1,318 @@
+"""Tests for the Fenix TFT API client."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.fenix_tft.api import FenixTFTApi, FenixTFTApiError
+from custom_components.fenix_tft.const import API_BASE, API_IDENTITY
+
+from .conftest import MOCK_DEVICE_ID, MOCK_INSTALLATION_ID, MOCK_ROOM_ID
+
+MOCK_INSTALLATIONS = [
+    {
+        "id": MOCK_INSTALLATION_ID,
+        "Il": "Home",
+        "rooms": [
+            {"Zn": MOCK_ROOM_ID, "devices": [{"Id_deviceId": MOCK_DEVICE_ID}]},
+        ],
+    }
+]
+
+MOCK_API_URL = f"{API_BASE}/businessmodule/v1/installations"
+MOCK_LOGIN_URL = f"{API_IDENTITY}/Account/Login"
+
+# Trimmed from the IdentityServer login page; ReturnUrl is HTML-escaped
+MOCK_LOGIN_PAGE = b"""<!DOCTYPE html>
+<html lang="en">
+<body>
+  <form method="post" action="/Account/Login">
+    <input type="hidden" id="ReturnUrl" name="ReturnUrl"
+      value="/connect/authorize/callback?client_id=app&amp;state=abc" />
+    <input class="form-control" id="Username" name="Username" value="" />
+    <input type="password" class="form-control" id="Password" name="Password" />
+    <button class="btn" name="button" value="login">Login</button>
+    <input name="__RequestVerificationToken" type="hidden"
+      value="CfDJ8Nq-token_value" />
+  </form>
+</body>
+</html>
+"""
+
+MOCK_DEVICE_PROPS = {
+    "Rn": {"value": "Living Room"},
+    "Ma": {"value": 725, "divFactor": 10},
+    "At": {"value": 665, "divFactor": 10},
+    "Cm": {"value": 6},
+}
+
+
+async def test_get_devices_ignores_trigger_timeout():
+    """A timed-out update trigger should not drop the fetched devices."""
+    api = FenixTFTApi(MagicMock(), "user", "password")
+
+    with (
+        patch.object(api, "_ensure_token", AsyncMock()),
+        patch.object(
+            api, "get_installations", AsyncMock(return_value=MOCK_INSTALLATIONS)
+        ),
+        patch.object(
+            api, "get_device_properties", AsyncMock(return_value=MOCK_DEVICE_PROPS)
+        ),
+        patch.object(
+            api, "trigger_device_updates", AsyncMock(side_effect=TimeoutError)
+        ) as trigger,
+    ):
+        devices = await api.get_devices()
+
+    trigger.assert_awaited_once_with(MOCK_INSTALLATION_ID)
+    assert [device["id"] for device in devices] == [MOCK_DEVICE_ID]
+    assert devices[0]["name"] == "Living Room"
+    assert devices[0]["target_temp"] == 22.5
+
+
+async def test_update_all_devices_reraises_unexpected_trigger_error():
+    """Only expected trigger failures are skipped; anything else propagates."""
+    api = FenixTFTApi(MagicMock(), "user", "password")
+    devices = [{"installation_id": "inst-1"}, {"installation_id": "inst-2"}]
+
+    async def _trigger(installation_id: str) -> dict:
+        if installation_id == "inst-1":
+            raise TimeoutError
+        msg = "unexpected payload"
+        raise RuntimeError(msg)
+
+    with (
+        patch.object(
+            api, "trigger_device_updates", AsyncMock(side_effect=_trigger)
+        ) as trigger,
+        pytest.raises(RuntimeError, match="unexpected payload"),
+    ):
+        await api.update_all_devices(devices)
+
+    assert trigger.await_count == 2
+
+
+async def test_get_installations_clears_cache_on_error():
+    """A failed installations fetch should drop the cached topology."""
+    api = FenixTFTApi(MagicMock(), "user", "password")
+    api._sub = "sub"
+    api._installations_cache = (float("-inf"), MOCK_INSTALLATIONS)
+
+    with (
+        patch.object(api, "_get_json", AsyncMock(side_effect=FenixTFTApiError("boom"))),
+        pytest.raises(FenixTFTApiError),
+    ):
+        await api.get_installations()
+
+    assert api._installations_cache is None
+
+
+def _login_page_session(body: bytes, status: int = 200) -> MagicMock:
+    """Return a session whose GET responds with the given login page."""
+    resp = MagicMock(status=status)
+    resp.read = AsyncMock(return_value=body)
+    session = MagicMock()
+    session.get.return_value.__aenter__.return_value = resp
+    return session
+
+
+async def test_fetch_login_page_extracts_form_inputs():
+    """CSRF token and ReturnUrl should be read from real login markup."""
+    api = FenixTFTApi(_login_page_session(MOCK_LOGIN_PAGE), "user", "password")
+
+    csrf_token, return_url = await api._fetch_login_page(MOCK_LOGIN_URL)
+
+    assert csrf_token == "CfDJ8Nq-token_value"
+    # &amp; is unescaped so the form post sends the original query string
+    assert return_url == "/connect/authorize/callback?client_id=app&state=abc"
+
+
+async def test_fetch_login_page_value_before_name():
+    """Attribute order should not matter, including single and no quotes."""
+    page = (
+        b"<input value='csrf' type=hidden name='__RequestVerificationToken'>"
+        b"<input value=/callback name=ReturnUrl>"
+    )
+    api = FenixTFTApi(_login_page_session(page), "user", "password")
+
+    assert await api._fetch_login_page(MOCK_LOGIN_URL) == ("csrf", "/callback")
+
+
+async def test_fetch_login_page_ignores_data_attributes():
+    """data-name and data-value attributes should never be matched."""
+    page = (
+        b'<input data-name="ReturnUrl" name="other" value="bad">'
+        b'<input name="ReturnUrl" data-value="bad" value="/callback">'
+        b'<input name="__RequestVerificationToken" value="csrf">'
+    )
+    api = FenixTFTApi(_login_page_session(page), "user", "password")
+
+    assert await api._fetch_login_page(MOCK_LOGIN_URL) == ("csrf", "/callback")
+
+
+async def test_fetch_login_page_missing_input():
+    """A page without both inputs should yield no credentials."""
+    page = MOCK_LOGIN_PAGE.replace(b"__RequestVerificationToken", b"OtherToken")
+    api = FenixTFTApi(_login_page_session(page), "user", "password")
+
+    assert await api._fetch_login_page(MOCK_LOGIN_URL) == (None, None)
+
+
+async def test_fetch_login_page_tolerates_undecodable_bytes():
+    """Bytes that are not UTF-8 elsewhere on the page should not break parsing."""
+    page = b"<p>Prihl\xe1senie</p>" + MOCK_LOGIN_PAGE
+    api = FenixTFTApi(_login_page_session(page), "user", "password")
+
+    csrf_token, return_url = await api._fetch_login_page(MOCK_LOGIN_URL)
+
+    assert csrf_token == "CfDJ8Nq-token_value"
+    assert return_url == "/connect/authorize/callback?client_id=app&state=abc"
+
+
+async def test_fetch_login_page_error_status():
+    """A non-200 login page should not be read or parsed."""
+    session = _login_page_session(MOCK_LOGIN_PAGE, status=500)
+    api = FenixTFTApi(session, "user", "password")
+
+    assert await api._fetch_login_page(MOCK_LOGIN_URL) == (None, None)
+    session.get.return_value.__aenter__.return_value.read.assert_not_awaited()
+
+
+async def test_login_submits_extracted_csrf_token():
+    """Login should post the CSRF token and ReturnUrl parsed from the page."""
+    api = FenixTFTApi(_login_page_session(MOCK_LOGIN_PAGE), "user", "password")
+
+    with (
+        patch.object(
+            api,
+            "_start_authorization",
+            AsyncMock(return_value=(MOCK_LOGIN_URL, "verifier", "state", "nonce")),
+        ),
+        patch.object(api, "_submit_login_form", AsyncMock(return_value=None)) as submit,
+    ):
+        assert await api.login() is False
+
+    submit.assert_awaited_once_with(
+        MOCK_LOGIN_URL,
+        "/connect/authorize/callback?client_id=app&state=abc",
+        "CfDJ8Nq-token_value",
+    )
+
+
+def _authenticated_api(session: MagicMock) -> FenixTFTApi:
+    """Return an API client holding a valid, unexpired "old" access token."""
+    api = FenixTFTApi(session, "user", "password")
+    api._access_token = "old"
+    api._refresh_token = "refresh"
+    api._token_expires = time.time() + 3600
+    return api
+
+
+def _renew_to_new_token(api: FenixTFTApi):
+    """Return a _renew_token replacement that stores a fresh "new" token."""
+
+    async def _renew() -> None:
+        api._access_token = "new"
+        api._token_expires = time.time() + 3600
+
+    return _renew
+
+
+async def test_api_request_renews_token_and_retries_after_401():
+    """A 401 should invalidate the token, renew it once and retry once."""
+    session = MagicMock()
+    rejected = MagicMock(status=401)
+    session.request = AsyncMock(side_effect=[rejected, MagicMock(status=200)])
+    api = _authenticated_api(session)
+
+    with patch.object(
+        api, "_renew_token", AsyncMock(side_effect=_renew_to_new_token(api))
+    ) as renew:
+        async with api._api_request("GET", MOCK_API_URL) as resp:
+            assert resp.status == 200
+
+    renew.assert_awaited_once()
+    rejected.release.assert_called_once()
+    assert [
+        call.kwargs["headers"]["Authorization"]
+        for call in session.request.await_args_list
+    ] == ["Bearer old", "Bearer new"]
+
+
+async def test_api_request_second_401_raises():
+    """A 401 on the retry should surface as an API error, not loop."""
+    session = MagicMock()
+    session.request = AsyncMock(
+        side_effect=[MagicMock(status=401), MagicMock(status=401)]
+    )
+    api = _authenticated_api(session)
+
+    with (
+        patch.object(
+            api, "_renew_token", AsyncMock(side_effect=_renew_to_new_token(api))
+        ) as renew,
+        pytest.raises(FenixTFTApiError),
+    ):
+        await api._get_json(MOCK_API_URL, "Get installations")
+
+    renew.assert_awaited_once()
+    assert session.request.await_count == 2
+
+
+async def test_api_request_concurrent_401s_renew_once():
+    """Requests rejected together should share a single token renewal."""
+    concurrent_requests = 3
+    rejected_count = 0
+    all_sent = asyncio.Event()
+
+    async def _request(method, url, headers, **kwargs):
+        nonlocal rejected_count
+        if headers["Authorization"] == "Bearer old":
+            # Hold every request until all of them were sent with the old token
+            rejected_count += 1
+            if rejected_count == concurrent_requests:
+                all_sent.set()
+            await all_sent.wait()
+            return MagicMock(status=401)
+        return MagicMock(status=200)
+
+    session = MagicMock()
+    session.request = AsyncMock(side_effect=_request)
+    api = _authenticated_api(session)
+
+    async def _fetch_status() -> int:
+        async with api._api_request("GET", MOCK_API_URL) as resp:
+            return resp.status
+
+    with patch.object(
+        api, "_renew_token", AsyncMock(side_effect=_renew_to_new_token(api))
+    ) as renew:
+        statuses = await asyncio.gather(
+            *(_fetch_status() for _ in range(concurrent_requests))
+        )
+
+    assert statuses == [200] * concurrent_requests
+    renew.assert_awaited_once()
+
+
+async def test_ensure_token_concurrent_callers_renew_once():
+    """Callers waiting on the token lock should reuse the renewed token."""
+    api = FenixTFTApi(MagicMock(), "user", "password")
+    new_token = _renew_to_new_token(api)
+
+    async def _slow_renew() -> None:
+        # Yield so the other callers queue up on the lock meanwhile
+        await asyncio.sleep(0)
+        api._refresh_token = "refresh"
+        await new_token()
+
+    with patch.object(api, "_renew_token", AsyncMock(side_effect=_slow_renew)) as renew:
+        await asyncio.gather(*(api._ensure_token() for _ in range(3)))
+
+    renew.assert_awaited_once()
+    assert api._access_token == "new"
@@ -22,7 +22,7 @@ from custom_components.fenix_tft.coordinator import (
     FenixTFTCoordinator,
 )
 
-from .conftest import MOCK_DEVICE, MOCK_DEVICE_ID
+from .conftest import MOCK_DEVICE, MOCK_DEVICE_ID, MOCK_INSTALLATION_ID
 
 
 @pytest.fixture
@@ -194,3 +194,29 @@ async def test_coordinator_pending_optimistic_count(coordinator, mock_api):
 
     coordinator.update_device_preset_mode(MOCK_DEVICE_ID, PRESET_MODE_MANUAL)
     assert coordinator.pending_optimistic_update_count == 1
+
+
+async def test_coordinator_get_device_reindexes_on_new_data(coordinator, mock_api):
+    """Test get_device looks up by ID and follows coordinator.data replacement."""
+    coordinator.data = await coordinator._async_update_data()
+
+    assert coordinator.get_device(MOCK_DEVICE_ID) is coordinator.data[0]
+    assert coordinator.get_device("unknown") is None
+
+    coordinator.data = [{**MOCK_DEVICE, "id": "AA11BB22CC99"}]
+
+    assert coordinator.get_device(MOCK_DEVICE_ID) is None
+    assert coordinator.get_device("AA11BB22CC99") is coordinator.data[0]
+
+
+async def test_coordinator_installations_follow_data(coordinator, mock_api):
+    """Test installations are indexed from the current coordinator data."""
+    coordinator.data = await coordinator._async_update_data()
+
+    assert coordinator.installations == {MOCK_INSTALLATION_ID: "Home"}
+
+    coordinator.data = [
+        {**MOCK_DEVICE, "installation_id": "INST-2", "installation": "Cottage"}
+    ]
+
+    assert coordinator.installations == {"INST-2": "Cottage"}
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from itertools import pairwise
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from homeassistant.const import UnitOfEnergy
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
 from homeassistant.util import dt as dt_util
 
 from custom_components import fenix_tft
@@ -13,9 +15,21 @@ from custom_components.fenix_tft import (
     async_migrate_entry,
     async_remove_config_entry_device,
 )
-from custom_components.fenix_tft.const import DOMAIN
+from custom_components.fenix_tft.api import FenixTFTApiError
+from custom_components.fenix_tft.const import (
+    DOMAIN,
+    HOLIDAY_MODE_NONE,
+    VALID_HOLIDAY_MODES,
+)
+
+from .conftest import (
+    MOCK_DEVICE,
+    MOCK_DEVICE_ID,
+    MOCK_DEVICE_ID_2,
+    MOCK_INSTALLATION_ID,
+)
 
-from .conftest import MOCK_DEVICE_ID
+MOCK_INSTALLATION_ID_2 = "AABB1122CCEE"
 
 
 def _get_energy_entity_id(hass) -> str:
@@ -304,6 +318,69 @@ async def test_fetch_historical_energy_data_uses_yearly_aggregation_for_old_rang
     )
 
 
+def test_plan_energy_chunks_switches_aggregation_by_age():
+    """The planner should walk back from the end date, coarsening with age."""
+    end_date = dt_util.parse_datetime("2025-03-01T00:00:00+00:00")
+    assert end_date is not None
+    start_date = end_date - dt_util.dt.timedelta(days=120)
+
+    chunks = fenix_tft._plan_energy_chunks(start_date, end_date, 120, end_date)
+
+    assert [(period, days) for period, _start, _end, days in chunks] == [
+        ("Hour", 7),
+        ("Day", 30),
+        ("Day", 30),
+        ("Day", 30),
+        ("Month", 23),
+    ]
+    assert chunks[0][2] == end_date
+    assert chunks[-1][1] == start_date
+    for newer, older in pairwise(chunks):
+        assert older[2] == newer[1]
+
+
+def test_determine_aggregation_period_always_makes_progress():
+    """Every age bucket should yield a period and a chunk of at least one day."""
+    assert fenix_tft._determine_aggregation_period(0, 30) == ("Hour", 7)
+    assert fenix_tft._determine_aggregation_period(7, 100) == ("Day", 30)
+    assert fenix_tft._determine_aggregation_period(90, 400) == ("Month", 365)
+    assert fenix_tft._determine_aggregation_period(400, 1000) == ("Year", 365)
+    assert fenix_tft._determine_aggregation_period(10, 0) == ("Day", 1)
+
+
+async def test_fetch_historical_energy_data_keeps_chunk_order_and_skips_failures():
+    """Concurrent chunk fetches should keep plan order and tolerate API errors."""
+    api = AsyncMock()
+    api.get_room_historical_energy.side_effect = [
+        [{"startDateOfMetric": "2025-02-25T00:00:00+00:00", "sum": 1.0}],
+        FenixTFTApiError("chunk failed"),
+        [{"startDateOfMetric": "2024-12-01T00:00:00+00:00", "sum": 3.0}],
+    ]
+
+    end_date = dt_util.parse_datetime("2025-03-01T00:00:00+00:00")
+    assert end_date is not None
+    start_date = end_date - dt_util.dt.timedelta(days=60)
+
+    with patch(
+        "custom_components.fenix_tft.asyncio.sleep", return_value=None
+    ) as stagger:
+        result = await fenix_tft._fetch_historical_energy_data(
+            api,
+            "installation-id",
+            "room-id",
+            "subscription-id",
+            start_date,
+            end_date,
+            60,
+            "Bedroom",
+        )
+
+    calls = api.get_room_historical_energy.await_args_list
+    assert [call.args[5] for call in calls] == ["Hour", "Day", "Day"]
+    assert [call.args[0] for call in stagger.await_args_list] == [0.25, 0.5]
+    assert [point["sum"] for point in result] == [1.0, 3.0]
+
+
 async def test_async_remove_config_entry_device_no_runtime_data(
     hass, mock_config_entry, mock_api
 ):
@@ -323,3 +400,236 @@ async def test_async_remove_config_entry_device_no_runtime_data(
     )
 
     assert result is True
+
+
+def test_holiday_mode_applied_only_checks_target_installation():
+    """Holiday polling should stop once every device in the installation agrees."""
+    devices = [
+        {"installation_id": "inst-1", "holiday_mode": 2},
+        {"installation_id": "inst-1", "holiday_mode": 0},
+        {"installation_id": "inst-2", "holiday_mode": 0},
+    ]
+
+    assert not fenix_tft._holiday_mode_applied(devices, "inst-1", 2)
+    devices[1]["holiday_mode"] = 2
+    assert fenix_tft._holiday_mode_applied(devices, "inst-1", 2)
+    assert fenix_tft._holiday_mode_applied(devices, "inst-2", 0)
+
+
+async def test_holiday_refresh_polls_at_most_three_times():
+    """An unapplied holiday change should poll only a few times within 5 s."""
+    clock = [0.0]
+
+    async def fake_sleep(delay: float) -> None:
+        clock[0] += delay
+
+    hass = MagicMock()
+    hass.loop.time = lambda: clock[0]
+    config_entry = MagicMock()
+    coordinator = config_entry.runtime_data.coordinator
+    coordinator.async_refresh = AsyncMock()
+    coordinator.data = [{"installation_id": "inst-1", "holiday_mode": 0}]
+
+    with (
+        patch("custom_components.fenix_tft.asyncio.sleep", side_effect=fake_sleep),
+        patch("custom_components.fenix_tft.random.uniform", return_value=1.0),
+    ):
+        await fenix_tft._async_refresh_until_holiday_applied(
+            hass, config_entry, "inst-1", fenix_tft._HolidayRefresh(2)
+        )
+
+    assert coordinator.async_refresh.await_count == 3
+    assert clock[0] == 5.0
+
+
+async def test_holiday_refresh_restarts_for_change_sent_mid_refresh():
+    """A newer change recorded during a refresh should be polled for in full."""
+    clock = [0.0]
+
+    async def fake_sleep(delay: float) -> None:
+        clock[0] += delay
+
+    hass = MagicMock()
+    hass.loop.time = lambda: clock[0]
+    config_entry = MagicMock()
+    coordinator = config_entry.runtime_data.coordinator
+    coordinator.data = [{"installation_id": "inst-1", "holiday_mode": 0}]
+    refresh = fenix_tft._HolidayRefresh(2)
+
+    async def fake_refresh() -> None:
+        assert refresh.refreshing
+        if coordinator.async_refresh.await_count == 3:
+            # Another change sent while the last poll for mode 2 was in flight
+            refresh.holiday_mode = 1
+            refresh.restart = True
+
+    coordinator.async_refresh = AsyncMock(side_effect=fake_refresh)
+
+    with (
+        patch("custom_components.fenix_tft.asyncio.sleep", side_effect=fake_sleep),
+        patch("custom_components.fenix_tft.random.uniform", return_value=1.0),
+    ):
+        await fenix_tft._async_refresh_until_holiday_applied(
+            hass, config_entry, "inst-1", refresh
+        )
+
+    # Three polls for mode 2, then a fresh 5 s window with three more for mode 1
+    assert coordinator.async_refresh.await_count == 6
+    assert clock[0] == 10.0
+    assert not refresh.restart
+    assert not refresh.refreshing
+
+
+def _holiday_refresh_config_entry() -> MagicMock:
+    """Return a config entry mock whose background tasks never run."""
+
+    def _create_task(hass, target, name):
+        target.close()
+        return MagicMock()
+
+    config_entry = MagicMock(entry_id="entry")
+    config_entry.async_create_background_task.side_effect = _create_task
+    return config_entry
+
+
+def test_schedule_holiday_refresh_replaces_sleeping_loop():
+    """A loop waiting between polls should be cancelled and replaced."""
+    previous = fenix_tft._HolidayRefresh(2)
+    previous.task = MagicMock()
+    previous.task.done.return_value = False
+    hass = MagicMock()
+    hass.data = {fenix_tft.DATA_HOLIDAY_REFRESHES: {"entry_inst-1": previous}}
+    config_entry = _holiday_refresh_config_entry()
+
+    fenix_tft._async_schedule_holiday_refresh(hass, config_entry, "inst-1", 0)
+
+    previous.task.cancel.assert_called_once()
+    current = hass.data[fenix_tft.DATA_HOLIDAY_REFRESHES]["entry_inst-1"]
+    assert current is not previous
+    assert current.holiday_mode == 0
+
+
+def test_schedule_holiday_refresh_keeps_refreshing_loop():
+    """A loop in the middle of a refresh should be retargeted, not cancelled."""
+    previous = fenix_tft._HolidayRefresh(2)
+    previous.task = MagicMock()
+    previous.task.done.return_value = False
+    previous.refreshing = True
+    hass = MagicMock()
+    hass.data = {fenix_tft.DATA_HOLIDAY_REFRESHES: {"entry_inst-1": previous}}
+    config_entry = _holiday_refresh_config_entry()
+
+    fenix_tft._async_schedule_holiday_refresh(hass, config_entry, "inst-1", 0)
+
+    previous.task.cancel.assert_not_called()
+    config_entry.async_create_background_task.assert_not_called()
+    assert hass.data[fenix_tft.DATA_HOLIDAY_REFRESHES]["entry_inst-1"] is previous
+    assert previous.holiday_mode == 0
+    assert previous.restart
+
+
+async def test_entity_friendly_name_falls_back_to_object_id(hass):
+    """Friendly name should prefer state and drop the domain in the fallback."""
+    hass.states.async_set(
+        "sensor.living_room_energy", "1", {"friendly_name": "Living Room Energy"}
+    )
+
+    assert (
+        fenix_tft._entity_friendly_name(hass, "sensor.living_room_energy")
+        == "Living Room Energy"
+    )
+    assert (
+        fenix_tft._entity_friendly_name(hass, "sensor.bedroom_energy")
+        == "Bedroom Energy"
+    )
+
+
+async def _setup_with_devices(hass, mock_config_entry, mock_api, devices):
+    """Set up the integration with the given coordinator devices."""
+    mock_api.fetch_devices_with_energy_data.return_value = devices
+    mock_config_entry.add_to_hass(hass)
+    with patch("custom_components.fenix_tft.FenixTFTApi", return_value=mock_api):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+
+async def test_set_holiday_schedule_single_installation(
+    hass, mock_config_entry, mock_api
+):
+    """A single-installation account should skip the per-device lookup."""
+    await _setup_with_devices(hass, mock_config_entry, mock_api, [MOCK_DEVICE])
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "climate", DOMAIN, MOCK_DEVICE_ID
+    )
+
+    with (
+        patch(
+            "custom_components.fenix_tft._resolve_entity_context",
+            wraps=fenix_tft._resolve_entity_context,
+        ) as resolve,
+        patch(
+            "custom_components.fenix_tft._async_schedule_holiday_refresh"
+        ) as schedule,
+    ):
+        await hass.services.async_call(
+            DOMAIN,
+            "set_holiday_schedule",
+            {
+                "entity_id": entity_id,
+                "start_date": "2025-12-01 12:00:00",
+                "end_date": "2025-12-10 12:00:00",
+                "mode": "reduce",
+            },
+            blocking=True,
+        )
+
+    resolve.assert_not_called()
+    mock_api.set_holiday_schedule.assert_awaited_once()
+    installation_id, _start, _end, mode = mock_api.set_holiday_schedule.await_args.args
+    assert installation_id == MOCK_INSTALLATION_ID
+    assert mode == VALID_HOLIDAY_MODES["reduce"]
+    schedule.assert_called_once_with(
+        hass, mock_config_entry, MOCK_INSTALLATION_ID, VALID_HOLIDAY_MODES["reduce"]
+    )
+
+
+async def test_cancel_holiday_schedule_multiple_installations(
+    hass, mock_config_entry, mock_api
+):
+    """With several installations the entity's unique ID picks the device."""
+    second_device = {
+        **MOCK_DEVICE,
+        "id": MOCK_DEVICE_ID_2,
+        "name": "Cottage Bedroom",
+        "installation": "Cottage",
+        "installation_id": MOCK_INSTALLATION_ID_2,
+    }
+    await _setup_with_devices(
+        hass, mock_config_entry, mock_api, [MOCK_DEVICE, second_device]
+    )
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "climate", DOMAIN, MOCK_DEVICE_ID_2
+    )
+
+    with (
+        patch(
+            "custom_components.fenix_tft._get_device_id_from_registry",
+            wraps=fenix_tft._get_device_id_from_registry,
+        ) as registry_lookup,
+        patch(
+            "custom_components.fenix_tft._async_schedule_holiday_refresh"
+        ) as schedule,
+    ):
+        await hass.services.async_call(
+            DOMAIN,
+            "cancel_holiday_schedule",
+            {"entity_id": entity_id},
+            blocking=True,
+        )
+
+    # The unique ID resolves the device, so the registry fallback is not needed
+    registry_lookup.assert_not_called()
+    mock_api.cancel_holiday_schedule.assert_awaited_once_with(MOCK_INSTALLATION_ID_2)
+    schedule.assert_called_once_with(
+        hass, mock_config_entry, MOCK_INSTALLATION_ID_2, HOLIDAY_MODE_NONE
+    )